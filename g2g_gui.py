@@ -13,19 +13,31 @@ Updates in this version
 
 from __future__ import annotations
 
+import hashlib
+import io
+import re
+import struct
 import sys
+import time
 import traceback
+from array import array
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
 from enum import Enum
+from functools import lru_cache
+from itertools import chain
 
+import numpy as np
 import usb.core
 import usb.util
-from PyQt5.QtCore import Qt, QObject, QThread, pyqtSignal, QPointF, QTimer, QSettings
-from PyQt5.QtGui import QPainterPath, QPen, QFont, QColor, QPalette
+from PyQt5.QtCore import (
+    Qt, QObject, QThread, pyqtSignal, QTimer, QSettings, QByteArray, QDataStream,
+)
+from PyQt5.QtGui import QPainter, QPainterPath, QPen, QFont, QColor, QPalette, QOpenGLContext
 from PyQt5.QtWidgets import (
     QApplication,
     QFileDialog,
+    QGraphicsItem,
     QGraphicsPathItem,
     QGraphicsScene,
     QGraphicsView,
@@ -35,6 +47,7 @@ from PyQt5.QtWidgets import (
     QLabel,
     QLineEdit,
     QMessageBox,
+    QOpenGLWidget,
     QPushButton,
     QSizePolicy,
     QSpinBox,
@@ -47,16 +60,7 @@ from PyQt5.QtWidgets import (
 )
 
 import graphtec
-import mergepads
 import optimize
-from gerber_parser import extract_strokes_from_gerber
-
-# --------------------------------------------------------------------------- #
-# Patch legacy "rU" open mode                                                 #
-# --------------------------------------------------------------------------- #
-import builtins as _b
-_orig_open = _b.open  # keep original
-_b.open = lambda f, m="r", *a, **k: _orig_open(f, m.replace("U", ""), *a, **k)
 
 # --------------------------------------------------------------------------- #
 # Supported Silhouette devices                                               #
@@ -74,8 +78,10 @@ _DEVICES: List[Tuple[str, int, int]] = [
 ]
 _SUPPORTED = [(vid, pid) for _, vid, pid in _DEVICES]
 _NAME = {(vid, pid): name for name, vid, pid in _DEVICES}
+_SUPPORTED_SET = frozenset(_SUPPORTED)
 
 CHUNK = 8192  # 8 KiB USB bulk packet (tweak for finer progress if desired)
+CHUNK_MAX = 1 << 20  # upper bound for the "usb/chunk" settings override
 
 # --------------------------------------------------------------------------- #
 # Cutter state enum (mirrors py_silhouette DeviceState)                       #
@@ -87,6 +93,9 @@ class CutterState(Enum):
     PAUSED   = b"3"
     UNKNOWN  = None
 
+# status reply byte -> state
+_CODE_MAP = {s.value: s for s in CutterState if s.value is not None}
+
 _STATE_TEXT = {
     CutterState.READY:    "Ready",
     CutterState.MOVING:   "Busy / finishing job…",
@@ -102,33 +111,124 @@ _STATE_COLOR = {
     CutterState.UNKNOWN:  "#ca0",  # yellow
 }
 _CUTTING_COLOR = "#08f"  # blue while job streaming
+_STATE_TTL = 3.0  # s; a READY reply is shown this long before polling again
 
 # --------------------------------------------------------------------------- #
 # Helper functions                                                            #
 # --------------------------------------------------------------------------- #
-def floats(s: str) -> List[float]:
-    """Parse comma-separated numbers (spaces ignored)."""
-    return [float(x) for x in s.replace(" ", "").split(",") if x]
+_FLOAT_SEP = re.compile(r"[,\s]+")
+
+
+@lru_cache(maxsize=64)
+def floats(s: str) -> Tuple[float, ...]:
+    """Parse comma/whitespace-separated numbers; memoized, hence a tuple."""
+    try:
+        return tuple(float(x) for x in _FLOAT_SEP.split(s) if x)
+    except ValueError:
+        raise ValueError(f"not a comma- or space-separated list of numbers: {s!r}") from None
+
+
+# one QPainterPath element as serialized by QDataStream (type, x, y)
+_PATH_ELEM = np.dtype([("type", ">i4"), ("x", ">f8"), ("y", ">f8")])
+
+
+def path_from_strokes(strokes) -> QPainterPath:
+    """
+    Build one QPainterPath holding every stroke (moveTo + lineTo...).
+    The element list is written with NumPy in QDataStream layout and streamed
+    into the path in a single call (same trick as pyqtgraph's arrayToQPath),
+    so no per-vertex Python/Qt calls are made.
+    """
+    path = QPainterPath()
+    # an empty stroke would put a MoveTo index past the end (or onto the next
+    # stroke), and a lone point draws nothing: moveTo() would just replace it
+    strokes = [s for s in strokes if len(s) > 1]
+    if not strokes:
+        return path
+    lens = np.fromiter((len(s) for s in strokes), dtype=np.intp, count=len(strokes))
+    xy = np.concatenate([np.asarray(s, dtype=np.float64).reshape(-1, 2) for s in strokes])
+    starts = np.zeros(len(lens), dtype=np.intp)
+    np.cumsum(lens[:-1], out=starts[1:])
+
+    elems = np.empty(len(xy), dtype=_PATH_ELEM)
+    elems["type"] = QPainterPath.LineToElement
+    elems["type"][starts] = QPainterPath.MoveToElement
+    elems["x"] = xy[:, 0]
+    elems["y"] = xy[:, 1]
+
+    # <count> <elements> <cStart = last subpath start> <fillRule = OddEven>
+    data = struct.pack(">i", len(elems)) + elems.tobytes() + struct.pack(">ii", starts[-1], 0)
+    QDataStream(QByteArray(data)) >> path
+    return path
+
+
+def strokes_digest(strokes) -> bytes:
+    """Fingerprint of the stroke geometry (vertex counts + coordinates)."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(np.fromiter((len(s) for s in strokes), dtype=np.intp, count=len(strokes)).tobytes())
+    for s in strokes:
+        h.update(np.asarray(s, dtype=np.float64).tobytes())
+    return h.digest()
+
+
+_DEV_TTL = 3.0  # s; re-enumerate the bus at most this often
+_dev_cache: Tuple[float, list] = (float("-inf"), [])
+
+
+def _find_devs() -> list:
+    """
+    Connected supported cutters, in _SUPPORTED order.
+    One bus scan serves all callers for _DEV_TTL seconds (status poll, cut, …).
+    """
+    global _dev_cache
+    now = time.monotonic()
+    ts, devs = _dev_cache
+    if now - ts < _DEV_TTL:
+        return devs
+    found = {
+        (d.idVendor, d.idProduct): d
+        for d in usb.core.find(
+            find_all=True,
+            custom_match=lambda d: (d.idVendor, d.idProduct) in _SUPPORTED_SET,
+        )
+    }
+    devs = [found[k] for k in _SUPPORTED if k in found]
+    _dev_cache = (now, devs)
+    return devs
+
+
+def _forget_devs():
+    """Drop the enumeration cache (after USB errors, e.g. cutter unplugged)."""
+    global _dev_cache
+    _dev_cache = (float("-inf"), [])
 
 
 def detect_dev() -> Optional[str]:
     """Return first connected supported cutter name or None."""
-    for vid, pid in _SUPPORTED:
-        if usb.core.find(idVendor=vid, idProduct=pid):
-            return _NAME[(vid, pid)]
+    for dev in _find_devs():
+        return _NAME[(dev.idVendor, dev.idProduct)]
     return None
 
 
+def _active_config(dev):
+    """Active configuration of *dev*; SET_CONFIGURATION only if it has none yet."""
+    try:
+        return dev.get_active_configuration()
+    except usb.core.USBError:
+        pass
+    try:
+        dev.set_configuration()
+    except usb.core.USBError:
+        pass
+    return dev.get_active_configuration()
+
+
 def _open_dev_bi():
     """
     Open first supported Silhouette cutter and return (dev, intf, ep_out, ep_in).
     Caller *must* release & dispose.
     """
-    for vid, pid in _SUPPORTED:
-        dev = usb.core.find(idVendor=vid, idProduct=pid)
-        if not dev:
-            continue
-
+    for dev in _find_devs():
         try:
             if dev.is_kernel_driver_active(0):
                 try:
@@ -138,12 +238,7 @@ def _open_dev_bi():
         except (NotImplementedError, usb.core.USBError):
             pass
 
-        try:
-            dev.set_configuration()
-        except usb.core.USBError:
-            pass
-
-        cfg = dev.get_active_configuration()
+        cfg = _active_config(dev)
         intf = cfg[(0, 0)]
 
         try:
@@ -174,40 +269,49 @@ def _open_dev_bi():
     raise RuntimeError("No supported cutter found")
 
 
+_status_handle: Optional[tuple] = None  # (dev, intf, ep_out, ep_in) between polls
+
+
+def _release_status_handle():
+    """Release the idle-poll handle (before a cut job claims the cutter, or on error)."""
+    global _status_handle
+    if _status_handle is None:
+        return
+    dev, intf, _, _ = _status_handle
+    _status_handle = None
+    try:
+        usb.util.release_interface(dev, intf.bInterfaceNumber)
+    except Exception:
+        pass
+    usb.util.dispose_resources(dev)
+
+
 def query_cutter_state(timeout_ms: int = 500) -> CutterState:
     """
     Poll the cutter's current state using the ESC-0x05 command.
     Returns a CutterState enum. Raises RuntimeError if no device found.
+    The claimed device stays open for the next poll; call
+    _release_status_handle() before anything else claims it.
     """
-    dev = intf = ep_out = ep_in = None
+    global _status_handle
     try:
-        dev, intf, ep_out, ep_in = _open_dev_bi()
+        if _status_handle is None:
+            _status_handle = _open_dev_bi()
+        dev, intf, ep_out, ep_in = _status_handle
         ep_out.write(b"\x1b\x05", timeout=0)  # status request
 
         try:
             data_arr = ep_in.read(ep_in.wMaxPacketSize or 64, timeout=timeout_ms)
-            try:
-                data = data_arr.tobytes()
-            except AttributeError:
-                data = bytes(data_arr)
+            code = bytes(data_arr[:1])  # array('B') or bytes alike
         except usb.core.USBError:
-            data = b""
+            code = b""
 
-        code = data[:1] if data else b""
-        if   code == CutterState.READY.value:    return CutterState.READY
-        elif code == CutterState.MOVING.value:   return CutterState.MOVING
-        elif code == CutterState.UNLOADED.value: return CutterState.UNLOADED
-        elif code == CutterState.PAUSED.value:   return CutterState.PAUSED
-        else:                                    return CutterState.UNKNOWN
+        return _CODE_MAP.get(code, CutterState.UNKNOWN)
 
-    finally:
-        if dev is not None and intf is not None:
-            try:
-                usb.util.release_interface(dev, intf.bInterfaceNumber)
-            except Exception:
-                pass
-        if dev is not None:
-            usb.util.dispose_resources(dev)
+    except Exception:
+        _release_status_handle()
+        _forget_devs()
+        raise
 
 
 # --------------------------------------------------------------------------- #
@@ -215,17 +319,55 @@ def query_cutter_state(timeout_ms: int = 500) -> CutterState:
 # --------------------------------------------------------------------------- #
 class ZoomView(QGraphicsView):
     _STEP, _MIN, _MAX = 1.15, -10, 20
+    _STEP_DN = 1 / _STEP
+    _AA_Z = 1  # antialias only once zoomed in past the fitted view
+    _AA_MAX_PTS = 50_000  # ...and never for boards with more vertices than this
+
+    def __init__(self, scene=None, parent=None):
+        super().__init__(scene, parent)
+        # rasterize on the GPU when a GL context is available (VMs/RDP may lack one)
+        if QOpenGLContext().create():
+            self.setViewport(QOpenGLWidget())
+        # no painter save/restore or AA margins per item
+        self.setOptimizationFlags(
+            QGraphicsView.DontSavePainterState | QGraphicsView.DontAdjustForAntialiasing
+        )
+        # one big path item: repainting the viewport beats dirty-region bookkeeping
+        self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        self._pts = 0
+        self._z = 0  # wheel steps away from the last fit
+
+    def set_point_count(self, n: int):
+        """Tell the view how many vertices the preview holds (AA threshold)."""
+        self._pts = n
+        self._update_aa()
+
+    def _update_aa(self):
+        # zoomed out, edges are sub-pixel anyway: aliased drawing is much cheaper;
+        # dense boards stay aliased, AA shading cost would dominate every repaint
+        self.setRenderHint(
+            QPainter.Antialiasing,
+            self._pts <= self._AA_MAX_PTS and self._z >= self._AA_Z,
+        )
+
+    def fit(self, rect):
+        """fitInView(*rect*) and restart the wheel-zoom range from there."""
+        self.fitInView(rect, Qt.KeepAspectRatio)
+        self._z = 0
+        self._update_aa()
 
     def wheelEvent(self, ev):
         dy = ev.angleDelta().y()
         if dy == 0:
             return super().wheelEvent(ev)
         d = 1 if dy > 0 else -1
-        if not (self._MIN <= getattr(self, "_z", 0) + d <= self._MAX):
+        z = self._z + d
+        if not (self._MIN <= z <= self._MAX):
             return
-        f = self._STEP if d > 0 else 1 / self._STEP
+        f = self._STEP if d > 0 else self._STEP_DN
         self.scale(f, f)
-        self._z = getattr(self, "_z", 0) + d
+        self._z = z
+        self._update_aa()
 
 
 # --------------------------------------------------------------------------- #
@@ -236,19 +378,16 @@ class UsbSender(QThread):
     finished = pyqtSignal()
     error = pyqtSignal(str)
 
-    def __init__(self, fn: Path, parent=None):
+    def __init__(self, fn: Path, chunk: int = CHUNK, parent=None):
         super().__init__(parent)
         self.fn = fn
+        self.chunk = chunk
         self.canceled = False  # debug marker
 
     @staticmethod
     def _open_dev():
         """Return (dev, intf, ep_out) for first supported cutter (OUT only)."""
-        for vid, pid in _SUPPORTED:
-            dev = usb.core.find(idVendor=vid, idProduct=pid)
-            if not dev:
-                continue
-
+        for dev in _find_devs():
             try:
                 if dev.is_kernel_driver_active(0):
                     try:
@@ -258,12 +397,7 @@ class UsbSender(QThread):
             except (NotImplementedError, usb.core.USBError):
                 pass
 
-            try:
-                dev.set_configuration()
-            except usb.core.USBError:
-                pass
-
-            cfg = dev.get_active_configuration()
+            cfg = _active_config(dev)
             intf = cfg[(0, 0)]
 
             try:
@@ -294,22 +428,36 @@ class UsbSender(QThread):
             dev, intf, ep = self._open_dev()
             size = max(1, self.fn.stat().st_size)
             sent = 0
+            last_pct = -1
+            # whole max-size packets per write: no short packet mid-stream
+            pkt = ep.wMaxPacketSize or 64
+            n = max(1, self.chunk // pkt) * pkt
+            # reused for every chunk; pyusb hands array('B') to libusb uncopied
+            buf = array("B", bytes(n))
+            write, emit = ep.write, self.progress.emit
+            interrupted = self.isInterruptionRequested
             with self.fn.open("rb") as fh:
+                readinto = fh.readinto
                 while True:
-                    if self.isInterruptionRequested():
+                    if interrupted():
                         self.canceled = True
                         break
-                    chunk = fh.read(CHUNK)
-                    if not chunk:
+                    k = readinto(buf)
+                    if not k:
                         break
-                    if self.isInterruptionRequested():
+                    if interrupted():
                         self.canceled = True
                         break
-                    ep.write(chunk, timeout=0)
-                    sent += len(chunk)
-                    self.progress.emit(int(sent / size * 100))
+                    write(buf if k == n else buf[:k], timeout=0)
+                    sent += k
+                    # only cross the thread boundary when the bar would move
+                    pct = sent * 100 // size
+                    if pct != last_pct:
+                        last_pct = pct
+                        emit(pct)
             self.finished.emit()
         except Exception as e:
+            _forget_devs()
             self.error.emit(str(e))
         finally:
             if dev is not None and intf is not None:
@@ -321,6 +469,97 @@ class UsbSender(QThread):
                 usb.util.dispose_resources(dev)
 
 
+# --------------------------------------------------------------------------- #
+# Job preparation thread (parse / merge / optimize / write)                   #
+# --------------------------------------------------------------------------- #
+class PrepareWorker(QThread):
+    strokes = pyqtSignal(list)  # final strokes (inches) for the preview
+    finished = pyqtSignal()
+    error = pyqtSignal(str)
+
+    def __init__(self, gbr: Path, out: Path, off, br, mat, speeds, forces, cm,
+                 merge_thresh=None, parent=None):
+        super().__init__(parent)
+        self.gbr, self.out = gbr, out
+        self.off, self.br, self.mat = off, br, mat
+        self.speeds, self.forces, self.cm = speeds, forces, cm
+        self.merge_thresh = merge_thresh  # None -> no pad merging
+
+    def run(self):
+        try:
+            strokes, extent = self._load()
+            if self.isInterruptionRequested():
+                return  # window closing: don't start writing the job file
+            self._write(strokes, extent)
+            self.finished.emit()
+        except Exception:
+            self.error.emit(traceback.format_exc())
+
+    def _load(self):
+        """Parsed strokes (inches) and their (max_x, max_y) extent."""
+        # imported on first use: pcb-tools and scipy add noticeably to GUI startup
+        from gerber_parser import extract_strokes_from_gerber
+
+        # an empty stroke cuts nothing; no strokes at all is not a job
+        strokes = [s for s in extract_strokes_from_gerber(str(self.gbr)) if len(s)]
+        if not strokes:
+            raise RuntimeError(f"No cuttable geometry in {self.gbr}")
+        # one contiguous Nx2 float64 buffer (mm -> in); strokes become views into it
+        lens = np.fromiter(map(len, strokes), dtype=np.intp, count=len(strokes))
+        xy = np.fromiter(
+            chain.from_iterable(chain.from_iterable(strokes)),
+            dtype=np.float64, count=2 * int(lens.sum()),
+        ).reshape(-1, 2)
+        xy /= 25.4
+        strokes = np.split(xy, np.cumsum(lens)[:-1]) if len(lens) else []
+        if self.merge_thresh is None:
+            # strokes are views into xy: one reduction over the buffer
+            extent = tuple(np.maximum(xy.max(axis=0), 0.0).tolist()) if len(xy) else (0, 0)
+        else:
+            import mergepads
+            # mergepads compares/concatenates points as Python sequences
+            strokes = mergepads.fix_small_geometry([p.tolist() for p in strokes], *self.merge_thresh)
+            extent = optimize.max_extent(strokes)
+        self.strokes.emit(strokes)
+        return strokes, extent
+
+    def _write(self, strokes, extent):
+        off, br, mat = self.off, self.br, self.mat
+        has_border = any(br)
+        max_x, max_y = extent
+        bpath = np.array([
+            (-br[0], -br[1]),
+            (max_x + br[0], -br[1]),
+            (max_x + br[0], max_y + br[1]),
+            (-br[0], max_y + br[1]),
+        ], dtype=np.float64)
+
+        # many short commands: 1 MiB buffer -> few write() syscalls
+        with self.out.open("w", buffering=1 << 20) as fout:
+            g = graphtec.graphtec(out_file=fout)
+            g.start()
+            g.set(offset=(off[0] + br[0] + 0.5, off[1] + br[1] + 0.5), matrix=mat)
+
+            # every pass cuts the same path (only speed/force change): render
+            # the pass body once and repeat it, rather than re-serializing it
+            body = io.StringIO()
+            g.fd = body
+            if self.cm == 0:  # Enhanced / optimized
+                g.lines(optimize.optimize(strokes, br))
+            else:  # Standard / closed polys
+                for poly in strokes:
+                    g.closed_path(poly)
+            if has_border:
+                g.closed_path(bpath)
+            g.fd = fout
+            body = body.getvalue()
+
+            for s, f in zip(self.speeds, self.forces):
+                g.set(speed=s, force=f)
+                g.emit(body)
+            g.end()
+
+
 # --------------------------------------------------------------------------- #
 # Multi-Pass widget (keeps Speed / Force in sync)                             #
 # --------------------------------------------------------------------------- #
@@ -414,17 +653,25 @@ class MultiPassWidget(QWidget):
 class Gui(QWidget):
     def __init__(self):
         super().__init__()
-        self._strokes: List[List[Tuple[float, float]]] = []
+        # inches: Nx2 views into PrepareWorker's buffer, or lists once pads are merged
+        self._strokes: List[Union[np.ndarray, List[Tuple[float, float]]]] = []
+        self._preview_item: Optional[QGraphicsPathItem] = None  # merged strokes path
+        self._preview_digest: Optional[bytes] = None  # strokes_digest() of that path
+        self._placeholder_item = None  # 'Preview' text item while no strokes are loaded
         self._sender: Optional[UsbSender] = None  # active USB job
+        self._preparer: Optional[PrepareWorker] = None  # active prepare job
         self._job_active = False
         self._cut_cancel_requested = False  # GUI-scoped cancel flag
+        self._last_state = CutterState.UNKNOWN  # last polled status ...
+        self._last_state_ts = float("-inf")    # ... and when (time.monotonic())
+        self._qs = QSettings("Rob0xFF", "Gerber2Graphtec")  # org/app as requested
         self._build_ui()
         self._load_settings()  # <-- load persisted values
 
     # ------------------------- settings helpers -----------------------------
     def _settings(self) -> QSettings:
-        # org/app as requested
-        return QSettings("Rob0xFF", "Gerber2Graphtec")
+        # one instance for the Gui's lifetime: no store re-parse per load/save/cut
+        return self._qs
 
     def _update_pen_color(self):
         """
@@ -448,17 +695,33 @@ class Gui(QWidget):
             fg = QColor("#000000")
             txt = QColor("#808080")
 
+        # cosmetic hairline: 1 device pixel at any zoom, and no stroker pass
+        # for the item's bounding rect (QGraphicsPathItem strokes wide pens)
         self._preview_pen = QPen(fg)
-        self._preview_pen.setWidthF(0.001)
+        self._preview_pen.setCosmetic(True)
+        self._preview_pen.setWidth(0)
         self._preview_text_color = txt
 
     def changeEvent(self, ev):
         from PyQt5.QtCore import QEvent
         if ev.type() == QEvent.PaletteChange:
             self._update_pen_color()
-            self._show_preview()
+            if self._preview_item is not None:
+                self._preview_item.setPen(self._preview_pen)  # recolor only; keep the path
+            else:
+                self._show_preview()
         super().changeEvent(ev)
 
+    def closeEvent(self, ev):
+        # never let Qt destroy a QThread that is still running
+        if self._preparer is not None:
+            self._preparer.requestInterruption()
+            self._preparer.wait()
+        # the idle poll keeps the cutter claimed; hand it back to other programs
+        self._dev_timer.stop()
+        _release_status_handle()
+        super().closeEvent(ev)
+
         
     @staticmethod
     def _to_bool(v) -> bool:
@@ -515,25 +778,34 @@ class Gui(QWidget):
             if fo is not None:
                 self.multi_pass.force_spins[i].setValue(max(1, min(33, fo)))
 
-    def _save_settings(self):
-        s = self._settings()
-        # paths
-        s.setValue("paths/gerber",  self.inp["gerber"].text())
-        s.setValue("paths/output",  self.inp["output"].text())
-        # text params
-        s.setValue("params/offset",    self.offset_edit.text())
-        s.setValue("params/margin",    self.border_edit.text())
-        s.setValue("params/transform", self.matrix_edit.text())
-        # merge
-        s.setValue("params/merge_enabled", self.merge_chk.isChecked())
-        s.setValue("params/merge_tol",     self.merge_thresh_edit.text())
-        # mode
-        s.setValue("params/mode", self.mode_cmb.currentData())
-        # passes + per-pass
-        s.setValue("params/passes", self.multi_pass.passes())
+    def _settings_snapshot(self) -> dict:
+        """Current field values, keyed like the persisted settings."""
+        v = {
+            # paths
+            "paths/gerber":  self.inp["gerber"].text(),
+            "paths/output":  self.inp["output"].text(),
+            # text params
+            "params/offset":    self.offset_edit.text(),
+            "params/margin":    self.border_edit.text(),
+            "params/transform": self.matrix_edit.text(),
+            # merge
+            "params/merge_enabled": self.merge_chk.isChecked(),
+            "params/merge_tol":     self.merge_thresh_edit.text(),
+            # mode
+            "params/mode": self.mode_cmb.currentData(),
+            # passes + per-pass
+            "params/passes": self.multi_pass.passes(),
+        }
         for i in range(3):
-            s.setValue(f"params/speed_{i+1}", self.multi_pass.speed_spins[i].value())
-            s.setValue(f"params/force_{i+1}", self.multi_pass.force_spins[i].value())
+            v[f"params/speed_{i+1}"] = self.multi_pass.speed_spins[i].value()
+            v[f"params/force_{i+1}"] = self.multi_pass.force_spins[i].value()
+        return v
+
+    def _save_settings(self, values: Optional[dict] = None):
+        """Persist *values* (a _settings_snapshot(); default: the fields now)."""
+        s = self._settings()
+        for key, val in (values or self._settings_snapshot()).items():
+            s.setValue(key, val)
         s.sync()
 
     # ------------------------- UI layout ------------------------------------
@@ -585,7 +857,7 @@ class Gui(QWidget):
             btn = QPushButton("…")
             btn.setToolTip("Browse…")
             fg.addWidget(btn, row, 2)
-            btn.clicked.connect(lambda _, op=is_open: self._browse(op))
+            btn.clicked.connect(lambda _, op=is_open, tgt=le: self._browse(op, tgt))
 
         add_path(0, "Gerber",  "gerber",  "in.gbr",       True,  "Input Gerber layer to cut.")
         add_path(1, "Job file","output",  "out.graphtec", False, "Where to write the Graphtec/Silhouette cut job.")
@@ -640,20 +912,22 @@ class Gui(QWidget):
 
         # Action buttons -----------------------------------------------------
         actions = QHBoxLayout()
-        btn_prep = QPushButton("1. Prepare")
-        btn_prep.setToolTip("Parse Gerber and generate Graphtec job file.")
-        btn_prep.clicked.connect(self._prepare)
-        actions.addWidget(btn_prep)
-        btn_cut = QPushButton("2. Cut")
-        btn_cut.setToolTip("Send the prepared job file to the cutter via USB.")
-        btn_cut.clicked.connect(self._cut)
-        actions.addWidget(btn_cut)
+        self.btn_prep = QPushButton("1. Prepare")
+        self.btn_prep.setToolTip("Parse Gerber and generate Graphtec job file.")
+        self.btn_prep.clicked.connect(self._prepare)
+        actions.addWidget(self.btn_prep)
+        self.btn_cut = QPushButton("2. Cut")
+        self.btn_cut.setToolTip("Send the prepared job file to the cutter via USB.")
+        self.btn_cut.clicked.connect(self._cut)
+        actions.addWidget(self.btn_cut)
         left.addLayout(actions)
 
         left.addSpacerItem(QSpacerItem(0, 0, QSizePolicy.Minimum, QSizePolicy.Expanding))
 
         # --- right pane (preview) ------------------------------------------
         self.scene = QGraphicsScene()
+        # preview is rebuilt wholesale and never hit-tested -> skip BSP indexing
+        self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
         self.view = ZoomView(self.scene)
         self.view.setMinimumSize(800, 600)
         # initialize preview colors for current theme
@@ -682,20 +956,27 @@ class Gui(QWidget):
             return
         name = detect_dev()
         if not name:
+            _release_status_handle()  # cutter gone: drop its stale handle
+            self._last_state_ts = float("-inf")
             self.ind.setStyleSheet("border-radius:5px;background:#a00")
             self.dev_lbl.setText("No cutter found")
             self.dev_state_lbl.setText("")
             self.dev_lbl.setToolTip("No supported Silhouette cutter detected. Connect cutter.")
             return
 
-        try:
-            state = query_cutter_state(timeout_ms=200)
-        except Exception as e:
-            self.ind.setStyleSheet("border-radius:5px;background:#ca0")
-            self.dev_lbl.setText(name)
-            self.dev_state_lbl.setText("Status error")
-            self.dev_state_lbl.setToolTip(str(e))
-            return
+        now = time.monotonic()
+        if self._last_state is CutterState.READY and now - self._last_state_ts < _STATE_TTL:
+            state = self._last_state  # idle and ready: skip the USB round-trip
+        else:
+            try:
+                state = query_cutter_state(timeout_ms=200)
+            except Exception as e:
+                self.ind.setStyleSheet("border-radius:5px;background:#ca0")
+                self.dev_lbl.setText(name)
+                self.dev_state_lbl.setText("Status error")
+                self.dev_state_lbl.setToolTip(str(e))
+                return
+            self._last_state, self._last_state_ts = state, now
 
         color = _STATE_COLOR[state]
         text = _STATE_TEXT[state]
@@ -716,25 +997,32 @@ class Gui(QWidget):
         self.dev_state_lbl.setText("Canceling…")
 
     # ------------------------- file dialogs --------------------------------
-    def _browse(self, is_open: bool):
+    def _browse(self, is_open: bool, target: QLineEdit):
         path, _ = (
             QFileDialog.getOpenFileName
             if is_open
             else QFileDialog.getSaveFileName
         )(self, "Select file", "", "All Files (*)")
         if path:
-            self.inp["gerber" if is_open else "output"].setText(path)
+            target.setText(path)
 
     # ------------------------- placeholder preview -------------------------
     def _show_empty_preview(self):
         """Show centered 'Preview' text when no strokes are loaded."""
+        # use theme‑contrasting text color
+        color = getattr(self, "_preview_text_color", Qt.lightGray)
+        if self._placeholder_item is not None:
+            # already shown (e.g. theme change): recolor, keep the laid-out text
+            self._placeholder_item.setDefaultTextColor(color)
+            return
         self.scene.clear()
+        self._preview_item = None
         item = self.scene.addText("Preview")
         font = QFont(item.font())
         font.setPointSize(30)  # already scaled down
         item.setFont(font)
-        # use theme‑contrasting text color
-        item.setDefaultTextColor(getattr(self, "_preview_text_color", Qt.lightGray))
+        item.setDefaultTextColor(color)
+        self._placeholder_item = item
         br = item.boundingRect()
         item.setPos(-br.width() / 2, -br.height() / 2)
         self.scene.setSceneRect(-br.width() / 2, -br.height() / 2, br.width(), br.height())
@@ -746,87 +1034,98 @@ class Gui(QWidget):
             self._show_empty_preview()
             return
 
+        # re-prepare with only offset/margin/matrix/passes changed -> same strokes
+        digest = strokes_digest(self._strokes)
+        if self._preview_item is not None and digest == self._preview_digest:
+            return
+
         self.scene.clear()
-        pen = getattr(self, "_preview_pen", QPen(Qt.black))
-        pen.setWidthF(0.001)  # widthF is safe; if already set, harmless
-        for poly in self._strokes:
-            path = QPainterPath(QPointF(*poly[0]))
-            for x, y in poly[1:]:
-                path.lineTo(QPointF(x, y))
-            item = QGraphicsPathItem(path)
-            item.setPen(pen)
-            self.scene.addItem(item)
-        self.scene.setSceneRect(self.scene.itemsBoundingRect())
-        self.view.fitInView(self.scene.sceneRect(), Qt.KeepAspectRatio)
+        self._placeholder_item = None
+        # all strokes share one pen -> one merged path / one scene item
+        path = path_from_strokes(self._strokes)
+        item = QGraphicsPathItem(path)
+        item.setPen(self._preview_pen)  # built once per theme in _update_pen_color
+        item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)  # reuse raster on pan/repaint
+        self.scene.addItem(item)
+        self._preview_item = item
+        self._preview_digest = digest
+        self.view.set_point_count(path.elementCount())
+        # line-only path: control points == geometry, and a cosmetic pen adds
+        # no scene-space margin -> no itemsBoundingRect() walk over the item
+        self.scene.setSceneRect(path.controlPointRect())
+        # fit once control returns to the event loop, not inside the slot
+        QTimer.singleShot(0, self._fit_preview)
+
+    def _fit_preview(self):
+        self.view.fit(self.scene.sceneRect())
 
     # ------------------------- prepare Graphtec file -----------------------
     def _prepare(self):
+        if self._preparer is not None:
+            return
         try:
             gbr = Path(self.inp["gerber"].text())
             out = Path(self.inp["output"].text())
             if not gbr.is_file():
                 raise RuntimeError("Gerber not found")
 
-            off = floats(self.offset_edit.text()) or [0, 0]
-            br  = floats(self.border_edit.text()) or [0, 0]
-            mat = floats(self.matrix_edit.text()) or [1, 0, 0, 1]
+            off = floats(self.offset_edit.text()) or (0, 0)
+            br  = floats(self.border_edit.text()) or (0, 0)
+            mat = floats(self.matrix_edit.text()) or (1, 0, 0, 1)
 
             speeds = self.multi_pass.speeds()
             forces = self.multi_pass.forces()
             cm = self.mode_cmb.currentData()
 
             merge = self.merge_chk.isChecked()
-            merge_thresh = floats(self.merge_thresh_edit.text()) or [0.014, 0.009]
+            merge_thresh = floats(self.merge_thresh_edit.text()) or (0.014, 0.009)
+        except Exception:
+            QMessageBox.critical(self, "Error", traceback.format_exc())
+            return
+
+        # the fields this job was prepared from; the user may edit them mid-run
+        snapshot = self._settings_snapshot()
 
-            strokes = extract_strokes_from_gerber(str(gbr))
-            strokes = [[(x / 25.4, y / 25.4) for x, y in poly] for poly in strokes]
-            if merge:
-                strokes = mergepads.fix_small_geometry(strokes, *merge_thresh)
+        # parse/optimize/write off the GUI thread; preview + dialogs stay here.
+        # No cut either: the output file is incomplete until the worker is done.
+        self.btn_prep.setEnabled(False)
+        self.btn_cut.setEnabled(False)
+        self._preparer = PrepareWorker(
+            gbr, out, off, br, mat, speeds, forces, cm,
+            merge_thresh if merge else None, self,
+        )
+
+        def _strokes(strokes: list):
             self._strokes = strokes
             self._show_preview()
 
-            max_x, max_y = optimize.max_extent(strokes)
-            bpath = [
-                (-br[0], -br[1]),
-                (max_x + br[0], -br[1]),
-                (max_x + br[0], max_y + br[1]),
-                (-br[0], max_y + br[1]),
-            ]
-
-            with out.open("w") as fout:
-                g = graphtec.graphtec(out_file=fout)
-                g.start()
-                g.set(offset=(off[0] + br[0] + 0.5, off[1] + br[1] + 0.5), matrix=mat)
-
-                def apply(s, f):
-                    g.set(speed=s, force=f)
-
-                if cm == 0:  # Enhanced / optimized
-                    lines = optimize.optimize(strokes, br)
-                    for s, f in zip(speeds, forces):
-                        apply(s, f)
-                        for x1, y1, x2, y2 in lines:
-                            g.line(x1, y1, x2, y2)
-                        if any(br):
-                            g.closed_path(bpath)
-                else:  # Standard / closed polys
-                    for s, f in zip(speeds, forces):
-                        apply(s, f)
-                        for poly in strokes:
-                            g.closed_path(poly)
-                        if any(br):
-                            g.closed_path(bpath)
-                g.end()
+        def _cleanup():
+            self._preparer.wait()  # signal is emitted just before run() returns
+            self._preparer.deleteLater()
+            self._preparer = None
+            self.btn_prep.setEnabled(True)
+            self.btn_cut.setEnabled(True)
 
+        def _done():
             # Save settings *after* successful prepare
-            self._save_settings()
-
+            self._save_settings(snapshot)
+            _cleanup()
             QMessageBox.information(self, "Done", f"File saved:\n{out}")
-        except Exception:
-            QMessageBox.critical(self, "Error", traceback.format_exc())
+
+        def _err(msg: str):
+            _cleanup()
+            QMessageBox.critical(self, "Error", msg)
+
+        self._preparer.strokes.connect(_strokes)
+        self._preparer.finished.connect(_done)
+        self._preparer.error.connect(_err)
+        self._preparer.start()
 
     # ------------------------- USB upload ----------------------------------
     def _cut(self):
+        if self._preparer is not None:
+            QMessageBox.warning(self, "Busy", "The job file is still being prepared.")
+            return
         if self._sender is not None and self._sender.isRunning():
             QMessageBox.warning(self, "Busy", "A cut job is already in progress.")
             return
@@ -879,13 +1178,19 @@ class Gui(QWidget):
             QMessageBox.warning(self, "Missing", "Prepare file first")
             return
 
+        _release_status_handle()  # UsbSender needs the interface to itself
+        self._last_state_ts = float("-inf")  # re-poll for real once the job ends
+
         dlg = QProgressDialog("Cutting … 0%", "Cancel", 0, 100, self)
         dlg.setWindowModality(Qt.WindowModal)
         dlg.setAutoClose(False)   # prevent auto-close -> spurious canceled()
         dlg.setAutoReset(False)
         self._dlg_finishing = False  # guard against programmatic close
 
-        self._sender = UsbSender(out, self)
+        # hidden "usb/chunk" setting: bytes per bulk write. Bigger = less per-call
+        # overhead, but coarser progress and slower cancel (cutter paces writes).
+        chunk = self._settings().value("usb/chunk", CHUNK, type=int)
+        self._sender = UsbSender(out, max(64, min(CHUNK_MAX, chunk)), self)
 
         def _prog(p: int):
             dlg.setValue(p)
@@ -19,9 +19,14 @@ list[list[tuple[float, float]]]
 """
 from __future__ import annotations
 
+import builtins
 import math
-from typing import List, Tuple
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from typing import Callable, Dict, List, Optional, Tuple
 
+import numpy as np
+from gerber import common, excellon, ipc356, rs274x
 from gerber import load_layer
 from gerber.primitives import (
     Line,
@@ -34,17 +39,43 @@ from gerber.primitives import (
     Outline,  # noqa: F401 (imported for completeness)
 )
 
+# ----------------------------------------------------------------------------
+# pcb-tools compatibility
+# ----------------------------------------------------------------------------
+
+def _open_no_u(file, mode="r", *args, **kwargs):
+    """``open()`` that drops the legacy universal-newline ``"U"`` flag."""
+    return builtins.open(file, mode.replace("U", ""), *args, **kwargs)
+
+
+# pcb-tools opens its inputs with mode "rU", which Python 3.11 rejects.
+# Shadow open() in just those modules instead of patching builtins globally.
+for _mod in (common, excellon, ipc356, rs274x):
+    _mod.open = _open_no_u
+
 # ----------------------------------------------------------------------------
 # Helper functions
 # ----------------------------------------------------------------------------
 
+_XY_GETTERS: Dict[type, Callable] = {}  # point type -> (x, y) extractor
+
+
 def xy(pt) -> Tuple[float, float]:
     """Return an *(x, y)* tuple regardless of *pt*'s type."""
-    if hasattr(pt, "x") and hasattr(pt, "y"):
-        return pt.x, pt.y
-    if isinstance(pt, (tuple, list)) and len(pt) >= 2:
-        return pt[0], pt[1]
-    raise TypeError(f"Cannot derive (x, y) coordinates from {pt!r}")
+    get = _XY_GETTERS.get(type(pt))
+    if get is None:
+        # decide once per point type; every vertex after that is one C call
+        if hasattr(pt, "x") and hasattr(pt, "y"):
+            get = attrgetter("x", "y")
+        elif isinstance(pt, (tuple, list)):
+            get = itemgetter(0, 1)
+        else:
+            raise TypeError(f"Cannot derive (x, y) coordinates from {pt!r}")
+        _XY_GETTERS[type(pt)] = get
+    try:
+        return get(pt)
+    except (AttributeError, IndexError):
+        raise TypeError(f"Cannot derive (x, y) coordinates from {pt!r}") from None
 
 
 # ----------------------------------------------------------------------------
@@ -54,6 +85,24 @@ def xy(pt) -> Tuple[float, float]:
 _DEFAULT_SEGMENTS = 32  # quality of circle/arc approximation
 
 
+@lru_cache(maxsize=8)
+def _unit_ramp(segments: int) -> np.ndarray:
+    """``0, 1/segments, …, 1`` (read-only, shared between calls)."""
+    t = np.arange(segments + 1) / segments
+    t.setflags(write=False)
+    return t
+
+
+@lru_cache(maxsize=8)
+def _unit_circle(segments: int) -> Tuple[np.ndarray, np.ndarray]:
+    """cos/sin tables for *segments* steps around the full circle (read-only)."""
+    t = np.linspace(0.0, 2 * math.pi, segments + 1)
+    cos_t, sin_t = np.cos(t), np.sin(t)
+    cos_t.setflags(write=False)
+    sin_t.setflags(write=False)
+    return cos_t, sin_t
+
+
 def _is_clockwise(a: Arc) -> bool:
     """Best‑effort check whether *a* sweeps clockwise.
 
@@ -88,21 +137,13 @@ def arc_points(a: Arc, segments: int = _DEFAULT_SEGMENTS) -> List[Tuple[float, f
     theta0 = math.atan2(sy - cy, sx - cx)
     theta1 = math.atan2(ey - cy, ex - cx)
 
-    cw = _is_clockwise(a)
+    # Signed sweep from theta0 to theta1 in the arc's direction:
+    # [0, 2π) counter-clockwise, (-2π, 0] clockwise
+    sweep = theta1 - theta0
+    sweep = -(-sweep % math.tau) if _is_clockwise(a) else sweep % math.tau
 
-    # Ensure theta1 lies "after" theta0 in the chosen direction
-    if cw and theta1 > theta0:
-        theta1 -= 2 * math.pi
-    elif (not cw) and theta1 < theta0:
-        theta1 += 2 * math.pi
-
-    return [
-        (
-            cx + a.radius * math.cos(theta0 + (theta1 - theta0) * i / segments),
-            cy + a.radius * math.sin(theta0 + (theta1 - theta0) * i / segments),
-        )
-        for i in range(segments + 1)
-    ]
+    t = theta0 + sweep * _unit_ramp(segments)
+    return list(zip((cx + a.radius * np.cos(t)).tolist(), (cy + a.radius * np.sin(t)).tolist()))
 
 
 def circle_points(c: Circle, segments: int = _DEFAULT_SEGMENTS) -> List[Tuple[float, float]]:
@@ -116,13 +157,51 @@ def circle_points(c: Circle, segments: int = _DEFAULT_SEGMENTS) -> List[Tuple[fl
     else:
         raise AttributeError("Circle primitive lacks both radius and width attributes")
 
-    return [
-        (
-            cx + r * math.cos(2 * math.pi * i / segments),
-            cy + r * math.sin(2 * math.pi * i / segments),
-        )
-        for i in range(segments + 1)
-    ]
+    cos_t, sin_t = _unit_circle(segments)
+    return list(zip((cx + r * cos_t).tolist(), (cy + r * sin_t).tolist()))
+
+
+def line_points(ln: Line) -> List[Tuple[float, float]]:
+    """Two‑point polyline of a straight *Line*."""
+    return [xy(ln.start), xy(ln.end)]
+
+
+def bbox_points(p) -> List[Tuple[float, float]]:
+    """Closed bounding‑box polyline of a *Rectangle* / *Obround* flash."""
+    cx, cy = xy(getattr(p, "position", getattr(p, "center", (0, 0))))
+    w = p.width
+    h = getattr(p, "height", w)
+    x0, x1 = cx - w / 2, cx + w / 2
+    y0, y1 = cy - h / 2, cy + h / 2
+    ll = (x0, y0)
+    return [ll, (x1, y0), (x1, y1), (x0, y1), ll]
+
+
+def polygon_points(p: Polygon) -> List[Tuple[float, float]]:
+    """Closed polyline through the vertices of a *Polygon* flash."""
+    verts = [xy(v) for v in p.vertices]
+    return verts + [verts[0]]
+
+
+# primitive class -> stroke builder, in the order the classes are tried
+_STROKE_BUILDERS = (
+    (Line, line_points),
+    (Circle, circle_points),
+    (Rectangle, bbox_points),
+    (Obround, bbox_points),
+    (Arc, arc_points),
+    (Polygon, polygon_points),
+)
+# resolved per concrete type on first sight; None -> container or unsupported
+_BUILDER_FOR: Dict[type, Optional[Callable]] = {}
+
+
+def _builder_for(t: type) -> Optional[Callable]:
+    """Stroke builder for primitive type *t* (subclasses included), or None."""
+    for cls, build in _STROKE_BUILDERS:
+        if issubclass(t, cls):
+            return build
+    return None
 
 
 # ----------------------------------------------------------------------------
@@ -134,50 +213,27 @@ def extract_strokes_from_gerber(path: str) -> List[List[Tuple[float, float]]]:
     layer = load_layer(path)
     strokes: List[List[Tuple[float, float]]] = []
 
-    def handle(p):
-        # 1) Straight line -----------------------------------------------------
-        if isinstance(p, Line):
-            strokes.append([xy(p.start), xy(p.end)])
-
-        # 2) Circle ------------------------------------------------------------
-        elif isinstance(p, Circle):
-            strokes.append(circle_points(p))
-
-        # 3) Rectangle / Obround → bounding‑box polyline -----------------------
-        elif isinstance(p, (Rectangle, Obround)):
-            cx, cy = xy(getattr(p, "position", getattr(p, "center", (0, 0))))
-            w = p.width
-            h = getattr(p, "height", w)
-            strokes.append(
-                [
-                    (cx - w / 2, cy - h / 2),
-                    (cx + w / 2, cy - h / 2),
-                    (cx + w / 2, cy + h / 2),
-                    (cx - w / 2, cy + h / 2),
-                    (cx - w / 2, cy - h / 2),
-                ]
-            )
-
-        # 4) Arc ---------------------------------------------------------------
-        elif isinstance(p, Arc):
-            strokes.append(arc_points(p))
-
-        # 5) Polygon flash -----------------------------------------------------
-        elif isinstance(p, Polygon):
-            verts = [xy(v) for v in p.vertices]
-            strokes.append(verts + [verts[0]])  # close polyline
-
-        # 6) Containers (Region, Outline, etc.) --------------------------------
+    # explicit depth-first worklist (same order as recursing into containers)
+    stack = list(reversed(layer.primitives))
+    while stack:
+        p = stack.pop()
+        t = type(p)
+        try:
+            build = _BUILDER_FOR[t]
+        except KeyError:
+            build = _BUILDER_FOR[t] = _builder_for(t)
+
+        # Line / Circle / Rectangle / Obround / Arc / Polygon
+        if build is not None:
+            strokes.append(build(p))
+
+        # Containers (Region, Outline, etc.)
         elif hasattr(p, "primitives"):
-            for sub in p.primitives:  # type: ignore[attr-defined]
-                handle(sub)
+            stack.extend(reversed(p.primitives))  # type: ignore[attr-defined]
 
-        # 7) Unknown primitive --------------------------------------------------
+        # Unknown primitive
         else:
-            print("⚠️  Unhandled primitive type:", type(p))
-
-    for prim in layer.primitives:
-        handle(prim)
+            print("⚠️  Unhandled primitive type:", t)
 
     return strokes
 
@@ -4,6 +4,7 @@
 
 import sys
 import math
+import numpy as np
 
 class graphtec:
   def __init__(self, out_file=None):
@@ -56,6 +57,19 @@ class graphtec:
     ty = ty*self.scale
     return tx,ty
 
+  # transform() for a whole Nx2 sequence of points at once, as flat x0,y0,x1,y1,...
+
+  def transform_points(self, pts):
+    p = np.asarray(pts, dtype=float).reshape(-1,2)
+    t = np.empty(2*len(p))
+    t[0::2] = (self.matrix[0]*p[:,0] + self.matrix[1]*p[:,1] + self.offset[0])*self.scale
+    t[1::2] = (self.matrix[2]*p[:,0] + self.matrix[3]*p[:,1] + self.offset[1])*self.scale
+    return t.tolist()
+
+  def polyline(self, pts):
+    t = self.transform_points(pts)
+    self.emit(('M%.3f,%.3f\x03' + 'D%.3f,%.3f\x03'*(len(t)//2 - 1)) % tuple(t))
+
   def move(self, x, y):
     x,y = self.transform(x,y)
     self.emit('M%.3f,%.3f\x03' % (x,y))
@@ -69,15 +83,11 @@ class graphtec:
   def closed_path(self, s):
     if len(s)<3:
       return
-    self.move(*s[0])
-    for p in s[1:]:
-      self.draw(*p)
-    self.draw(*s[0])
+    p = np.asarray(s, dtype=float)
+    self.polyline(np.vstack((p, p[:1])))
 
   def path(self, s):
-    self.move(*s[0])
-    for p in s[1:]:
-      self.draw(*p)
+    self.polyline(s)
 
   def comp(self, x1, y1, x2, y2):
     dx = x2 - x1
@@ -96,6 +106,23 @@ class graphtec:
     self.move(x1+dx1,y1+dy1)
     self.draw(x2+dx2,y2+dy2)
 
+  # line() for a whole Nx4 sequence of x1,y1,x2,y2 segments, written in one go
+
+  def lines(self, segs):
+    l = np.asarray(segs, dtype=float).reshape(-1,4)
+    if not len(l):
+      return
+    theta = np.arctan2(l[:,3] - l[:,1], l[:,2] - l[:,0])
+    c = np.cos(theta)
+    s = np.sin(theta)
+    p = np.empty((2*len(l),2))
+    p[0::2,0] = l[:,0] + -0.001*c
+    p[0::2,1] = l[:,1] + -0.001*s
+    p[1::2,0] = l[:,2] + 0.001*c
+    p[1::2,1] = l[:,3] + 0.001*s
+    t = self.transform_points(p)
+    self.emit('M%.3f,%.3f\x03D%.3f,%.3f\x03'*len(l) % tuple(t))
+
   def set(self, **kwargs):
     for k in kwargs:
       if k=='speed':
@@ -1,6 +1,7 @@
 # optimize paths for the graphtec cutter by dicing into individual lines, sorting by angle
 
 import math
+import numpy as np
 
 # rotate all geometry counterclockwise by theta degrees
 
@@ -71,9 +72,13 @@ def emit_training_line(ang):
   loc = (x2,y2)
   r.append((x1,y1,x2,y2))
 
+# every edge of every (implicitly closed) stroke, in both directions
+
 def dice(strokes):
   lines = []
   for s in strokes:
+    if isinstance(s, np.ndarray):
+      s = s.tolist()  # per-vertex ndarray indexing is slow; plain floats
     p = s[0]
     for q in s[1:]:
       lines.append((p[0],p[1],q[0],q[1]))
@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+
+# floats() parses the offset/margin/transform/merge fields of the GUI
+
+import pytest
+
+pytest.importorskip("PyQt5")
+pytest.importorskip("usb")
+
+from g2g_gui import floats
+
+def test_comma():
+  assert floats("1.0,4.5") == (1.0, 4.5)
+  assert floats("1,0.001,0,0.999") == (1.0, 0.001, 0.0, 0.999)
+
+def test_whitespace():
+  assert floats("1 2") == (1.0, 2.0)
+  assert floats("1\t2  3") == (1.0, 2.0, 3.0)
+
+def test_mixed():
+  assert floats("1.0, 4.5") == (1.0, 4.5)
+  assert floats(" 0.1 ,0.05 ") == (0.1, 0.05)
+  assert floats("-1, +2e-3") == (-1.0, 0.002)
+
+def test_trailing_and_repeated_separators():
+  assert floats("1,2,") == (1.0, 2.0)
+  assert floats("1,,2") == (1.0, 2.0)
+  assert floats("1, 2 ,") == (1.0, 2.0)
+
+def test_empty():
+  assert floats("") == ()
+  assert floats(" , ") == ()
+
+def test_cached_tuple():
+  a = floats("0.014,0.009")
+  assert isinstance(a, tuple)
+  assert floats("0.014,0.009") is a
+
+@pytest.mark.parametrize("s", ["0,O5", "1;2", "- 1"])
+def test_bad_input(s):
+  with pytest.raises(ValueError) as e:
+    floats(s)
+  assert str(e.value) == f"not a comma- or space-separated list of numbers: {s!r}"
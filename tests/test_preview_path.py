@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+
+# path_from_strokes() writes QPainterPath's QDataStream layout by hand;
+# check it against the same path built with moveTo/lineTo
+
+import pytest
+
+pytest.importorskip("PyQt5")
+pytest.importorskip("usb")
+
+from PyQt5.QtGui import QPainterPath
+import numpy as np
+from g2g_gui import path_from_strokes
+
+STROKES = [
+  [(0.0,0.0),(1.0,0.0),(1.0,1.0),(0.0,0.0)],
+  [(2.5,-1.25)],                         # single point
+  [(3.0,3.0),(4.125,3.5)],
+  np.array([[-1.0,2.0],[-2.0,4.5],[-3.0,1e-3]]),
+]
+
+def reference(strokes):
+  path = QPainterPath()
+  for s in strokes:
+    path.moveTo(*s[0])
+    for x,y in s[1:]:
+      path.lineTo(x,y)
+  return path
+
+def elements(path):
+  return [(e.type,e.x,e.y) for e in map(path.elementAt, range(path.elementCount()))]
+
+def test_matches_moveto_lineto():
+  got, want = path_from_strokes(STROKES), reference(STROKES)
+  assert got.elementCount() == want.elementCount()
+  assert elements(got) == elements(want)
+  assert got.fillRule() == want.fillRule()
+  assert got.boundingRect() == want.boundingRect()
+
+def test_empty_input():
+  assert path_from_strokes([]).isEmpty()
+  assert path_from_strokes([]).elementCount() == 0
+
+def test_empty_strokes_are_skipped():
+  got = path_from_strokes([[]] + STROKES[:1] + [[]])
+  assert elements(got) == elements(reference(STROKES[:1]))
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+
+# the NumPy emitters (polyline/closed_path/path/lines) must write exactly
+# what the per-point move/draw/line calls write
+
+import io
+import math
+import random
+
+import numpy as np
+import graphtec
+import optimize
+
+random.seed(4)
+STROKES = [
+  [(0.1,0.1),(0.6,0.1),(0.6,0.35),(0.1,0.35)],
+  [(1.0,1.0),(1.5,1.25),(1.2,1.9)],
+  [(0.25+0.05*math.cos(2*math.pi*i/32), 0.75+0.05*math.sin(2*math.pi*i/32)) for i in range(33)],
+  [(random.uniform(0,3), random.uniform(0,2)) for i in range(40)],
+  [(2.0,0.5),(2.5,0.5)],
+]
+BORDER = (0.1,0.05)
+MATRIX = (1,0.001,0,0.999)
+
+def new_job(fd):
+  g = graphtec.graphtec(out_file=fd)
+  g.set(offset=(1.6,5.05), matrix=MATRIX)
+  return g
+
+def scalar(strokes, cm):
+  fd = io.StringIO()
+  g = new_job(fd)
+  if cm==0:
+    for x in optimize.optimize(strokes, BORDER):
+      g.line(*x)
+  else:
+    for s in strokes:
+      if len(s)<3:
+        continue
+      g.move(*s[0])
+      for p in s[1:]:
+        g.draw(*p)
+      g.draw(*s[0])
+  return fd.getvalue()
+
+def vector(strokes, cm):
+  fd = io.StringIO()
+  g = new_job(fd)
+  if cm==0:
+    g.lines(optimize.optimize(strokes, BORDER))
+  else:
+    for s in strokes:
+      g.closed_path(s)
+  return fd.getvalue()
+
+def test_enhanced_mode():
+  want = scalar(STROKES, 0)
+  assert want
+  assert vector(STROKES, 0) == want
+  assert vector([np.array(s) for s in STROKES], 0) == want
+
+def test_standard_mode():
+  want = scalar(STROKES, 1)
+  assert want
+  assert vector(STROKES, 1) == want
+  assert vector([np.array(s) for s in STROKES], 1) == want
+
+def test_path():
+  for s in STROKES:
+    fd = io.StringIO()
+    g = new_job(fd)
+    g.move(*s[0])
+    for p in s[1:]:
+      g.draw(*p)
+    want = fd.getvalue()
+    fd.seek(0); fd.truncate()
+    g.path(s)
+    assert fd.getvalue() == want